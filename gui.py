@@ -1,17 +1,271 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
-import ttkbootstrap as ttk
-from ttkbootstrap.constants import *
-import threading
+from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import font as tkfont
+from tkinter.constants import *
+from concurrent.futures import ThreadPoolExecutor
 import os
+import string
 from datetime import datetime
-from integrity import ArchiveIntegrityChecker
+
+# ttkbootstrap is imported when the first window is created, keeping
+# `import gui` cheap for tests and the CLI
+ttk = None
+
+# Maximum number of lines kept in the activity log widget
+MAX_LOG_LINES = 500
+
+# Lines shown in the full log window, and how often it checks for new entries
+LOG_WINDOW_LINES = 1000
+LOG_POLL_MS = 500
+
+# Interval at which progress reported by the worker thread reaches the progress bar
+PROGRESS_TICK_MS = 100
+
+# Verification result categories and their labels in the file results list
+RESULT_STATUSES = (
+    ("modified", "Modified"),
+    ("missing", "Missing"),
+    ("errors", "Error"),
+    ("new", "New"),
+    ("ok", "OK"),
+)
+
+# Display names for hash algorithms in reports; others are shown upper-cased
+ALGORITHM_DISPLAY_NAMES = {
+    "md5": "MD5",
+    "sha1": "SHA-1",
+    "sha224": "SHA-224",
+    "sha256": "SHA-256",
+    "sha384": "SHA-384",
+    "sha512": "SHA-512",
+    "sha512_224": "SHA-512/224",
+    "sha512_256": "SHA-512/256",
+    "sha3_224": "SHA3-224",
+    "sha3_256": "SHA3-256",
+    "sha3_384": "SHA3-384",
+    "sha3_512": "SHA3-512",
+    "blake2b": "BLAKE2b",
+    "blake2s": "BLAKE2s",
+    "blake3": "BLAKE3",
+    "ripemd160": "RIPEMD-160",
+    "sm3": "SM3",
+}
+
+# Sentinel for widget options that use the shared monospace font
+MONO_FONT = object()
+
+# Widget options whose string values name an attribute of PreservGUI
+_BOUND_OPTIONS = ("command", "textvariable", "variable")
+
+# Main window layout. Each node is (widget type, attribute name or None,
+# widget options, pack options, children); see PreservGUI._build().
+UI_SPEC = (
+    ("Frame", None, {"padding": 20}, {"fill": BOTH, "expand": True}, (
+        # Header
+        ("Frame", None, {}, {"fill": X, "pady": (0, 20)}, (
+            ("Label", None, {"text": "Preserv", "font": ("Helvetica", 24, "bold"),
+                             "bootstyle": "primary"}, {}, ()),
+            ("Label", None, {"text": "Archive Integrity Checker", "font": ("Helvetica", 12),
+                             "bootstyle": "secondary"}, {}, ()),
+        )),
+        
+        # Archive selection section
+        ("LabelFrame", None, {"text": "Archive Selection", "padding": 15}, {"fill": X, "pady": (0, 20)}, (
+            # Archive path display and selection
+            ("Frame", None, {}, {"fill": X, "pady": (0, 10)}, (
+                ("Label", None, {"text": "Archive Folder:"}, {"anchor": W}, ()),
+                ("Frame", None, {}, {"fill": X, "pady": (5, 0)}, (
+                    ("Entry", "path_entry", {"textvariable": "archive_path", "state": "readonly",
+                                             "font": MONO_FONT},
+                     {"side": LEFT, "fill": X, "expand": True, "padx": (0, 10)}, ()),
+                    ("Button", None, {"text": "Browse...", "command": "select_archive_folder",
+                                      "bootstyle": "outline-primary"}, {"side": RIGHT}, ()),
+                )),
+            )),
+            
+            # Status display
+            ("Frame", None, {}, {"fill": X}, (
+                ("Label", None, {"text": "Status:"}, {"anchor": W}, ()),
+                ("Label", "status_label", {"textvariable": "status_var", "font": MONO_FONT,
+                                           "bootstyle": "info"}, {"anchor": W, "pady": (5, 0)}, ()),
+            )),
+        )),
+        
+        # Action buttons
+        ("Frame", None, {}, {"fill": X, "pady": (0, 20)}, (
+            ("Frame", None, {}, {"fill": X, "pady": (0, 10)}, (
+                ("Button", "generate_btn", {"text": "Generate Manifest", "command": "generate_manifest",
+                                            "bootstyle": "success", "width": 20},
+                 {"side": LEFT, "padx": (0, 10)}, ()),
+                ("Button", "verify_btn", {"text": "Verify Integrity", "command": "verify_integrity",
+                                          "bootstyle": "warning", "width": 20},
+                 {"side": LEFT, "padx": (0, 10)}, ()),
+            )),
+            ("Frame", None, {}, {"fill": X}, (
+                ("Button", "settings_btn", {"text": "Settings", "command": "show_settings",
+                                            "bootstyle": "outline-secondary", "width": 15},
+                 {"side": LEFT, "padx": (0, 10)}, ()),
+                ("Button", "logs_btn", {"text": "View Logs", "command": "show_logs",
+                                        "bootstyle": "outline-info", "width": 15},
+                 {"side": LEFT, "padx": (0, 10)}, ()),
+                ("Button", "export_btn", {"text": "Export Report", "command": "export_report",
+                                          "bootstyle": "outline-primary", "width": 15},
+                 {"side": LEFT}, ()),
+            )),
+        )),
+        
+        # Progress bar
+        ("Frame", None, {}, {"fill": X, "pady": (0, 20)}, (
+            ("Progressbar", "progress_bar", {"variable": "progress_var", "bootstyle": "success-striped"},
+             {"fill": X}, ()),
+        )),
+        
+        # Log output
+        ("LabelFrame", "log_frame", {"text": "Activity Log", "padding": 10}, {"fill": BOTH, "expand": True}, (
+            # Per-file results; a Treeview only lays out visible rows, so large archives stay responsive
+            ("Frame", None, {}, {"side": BOTTOM, "fill": X, "pady": (10, 0)}, (
+                ("Scrollbar", "results_scroll", {"orient": VERTICAL}, {"side": RIGHT, "fill": Y}, ()),
+                ("Treeview", "results_tree", {"columns": ("path", "status"), "show": "headings", "height": 6},
+                 {"side": LEFT, "fill": X, "expand": True}, ()),
+            )),
+            ("ScrolledText", "log_text", {"height": 10, "font": MONO_FONT, "wrap": tk.WORD, "state": tk.DISABLED},
+             {"fill": BOTH, "expand": True}, ()),
+        )),
+        
+        # Footer
+        ("Frame", None, {}, {"fill": X, "pady": (20, 0)}, (
+            ("Separator", None, {"orient": HORIZONTAL}, {"fill": X, "pady": (0, 10)}, ()),
+            ("Frame", None, {}, {"fill": X}, (
+                ("Button", None, {"text": "Exit", "command": "close", "bootstyle": "outline-danger",
+                                  "width": 10}, {"side": RIGHT}, ()),
+            )),
+        )),
+    )),
+)
+
+# Report templates, built once at import time
+_HTML_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Preserv - Archive Integrity Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }
+        .container { max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        h1 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }
+        h2 { color: #34495e; margin-top: 30px; }
+        .stats { background: #ecf0f1; padding: 20px; border-radius: 5px; margin: 20px 0; }
+        .stat-item { margin: 10px 0; }
+        .stat-label { font-weight: bold; color: #2c3e50; }
+        .footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #bdc3c7; color: #7f8c8d; font-size: 0.9em; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>Preserv - Archive Integrity Report</h1>
+        
+        <div class="stats">
+            <h2>Archive Summary</h2>
+            <div class="stat-item">
+                <span class="stat-label">Archive Path:</span> $archive_path
+            </div>
+            <div class="stat-item">
+                <span class="stat-label">Total Files:</span> $file_count
+            </div>
+            <div class="stat-item">
+                <span class="stat-label">Total Size:</span> $total_size_mb MB
+            </div>
+            <div class="stat-item">
+                <span class="stat-label">Last Generated:</span> $last_generated
+            </div>
+        </div>
+        
+        <h2>Integrity Information</h2>
+        <p>This archive has been processed using Preserv Archive Integrity Checker.</p>
+        <p>All files have been verified using $hash_algorithm cryptographic hashing for maximum integrity assurance.</p>
+        
+        <h2>Preservation Notes</h2>
+        <ul>
+            <li>Hash Algorithm: $hash_algorithm</li>
+            <li>Manifest Format: $manifest_format</li>
+            <li>Incremental Checking: Enabled</li>
+            <li>Logging: Comprehensive activity logging</li>
+        </ul>
+        
+        <div class="footer">
+            <p>Report generated on $report_time</p>
+            <p>Preserv Archive Integrity Checker - Professional archival preservation tool</p>
+        </div>
+    </div>
+</body>
+</html>
+        """)
+
+
+def _encode_template(template):
+    """Split a string.Template into (UTF-8 constant, placeholder name) segments.
+    
+    The final segment's placeholder name is None. Like Template.substitute,
+    "$$" becomes "$" and an invalid placeholder raises ValueError.
+    """
+    segments = []
+    text = []
+    pos = 0
+    for match in template.pattern.finditer(template.template):
+        text.append(template.template[pos:match.start()])
+        pos = match.end()
+        if match.group('escaped') is not None:
+            text.append(template.delimiter)
+            continue
+        name = match.group('named') or match.group('braced')
+        if name is None:
+            raise ValueError(f"Invalid placeholder in template at index {match.start('invalid')}")
+        segments.append((''.join(text).encode('utf-8'), name))
+        text = []
+    text.append(template.template[pos:])
+    segments.append((''.join(text).encode('utf-8'), None))
+    return segments
+
+
+# The HTML report is mostly static, so its constant parts are encoded only once
+_HTML_SEGMENTS = _encode_template(_HTML_TEMPLATE)
+
+_TEXT_TEMPLATE = string.Template("""
+PRESERV - ARCHIVE INTEGRITY REPORT
+==================================
+
+Generated: $report_time
+Archive Path: $archive_path
+
+ARCHIVE SUMMARY
+---------------
+Total Files: $file_count
+Total Size: $total_size_mb MB
+Last Generated: $last_generated
+
+INTEGRITY INFORMATION
+---------------------
+This archive has been processed using Preserv Archive Integrity Checker.
+All files have been verified using $hash_algorithm cryptographic hashing for maximum integrity assurance.
+
+PRESERVATION NOTES
+------------------
+- Hash Algorithm: $hash_algorithm
+- Manifest Format: $manifest_format
+- Incremental Checking: Enabled
+- Logging: Comprehensive activity logging
+
+For detailed verification results, run the integrity verification process.
+        """)
 
 
 class PreservGUI:
     """Modern GUI for Preserv Archive Integrity Checker."""
     
     def __init__(self):
+        global ttk
+        import ttkbootstrap as ttk
+        
         self.root = ttk.Window(
             title="Preserv - Archive Integrity Checker",
             themename="cosmo",
@@ -19,192 +273,98 @@ class PreservGUI:
             resizable=(True, True)
         )
         
-        # Initialize integrity checker
-        self.checker = ArchiveIntegrityChecker()
+        # Integrity checker is created on first use (see the checker property)
+        self._checker = None
+        
+        # Manifest stats cache, keyed on the manifest file's mtime
+        self._stats_cache = None
+        self._stats_mtime = None
         
         # Variables
         self.archive_path = tk.StringVar()
         self.progress_var = tk.DoubleVar()
         self.status_var = tk.StringVar(value="Ready")
         
-        # Load saved archive path
-        if self.checker.config.get('archive_path'):
-            self.archive_path.set(self.checker.config['archive_path'])
-        
-        self.setup_ui()
-        self.update_status()
-    
-    def setup_ui(self):
-        """Setup the user interface."""
-        # Main container
-        main_frame = ttk.Frame(self.root, padding=20)
-        main_frame.pack(fill=BOTH, expand=True)
+        # Last values written to the Tk variables, to skip no-op updates
+        self._last_status_text = "Ready"
+        self._last_progress = 0.0
         
-        # Header
-        header_frame = ttk.Frame(main_frame)
-        header_frame.pack(fill=X, pady=(0, 20))
-        
-        title_label = ttk.Label(
-            header_frame,
-            text="Preserv",
-            font=("Helvetica", 24, "bold"),
-            bootstyle="primary"
-        )
-        title_label.pack()
+        # (raw ISO string, formatted string) for the manifest's last generated time
+        self._last_gen_fmt_cache = ('', '')
         
-        subtitle_label = ttk.Label(
-            header_frame,
-            text="Archive Integrity Checker",
-            font=("Helvetica", 12),
-            bootstyle="secondary"
-        )
-        subtitle_label.pack()
+        # Single worker thread that runs all long operations in order; once
+        # the window is closed the running operation stops between files
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preserv-op")
+        self._closed = False
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         
-        # Archive selection section
-        archive_frame = ttk.LabelFrame(main_frame, text="Archive Selection", padding=15)
-        archive_frame.pack(fill=X, pady=(0, 20))
-        
-        # Archive path display and selection
-        path_frame = ttk.Frame(archive_frame)
-        path_frame.pack(fill=X, pady=(0, 10))
-        
-        ttk.Label(path_frame, text="Archive Folder:").pack(anchor=W)
-        
-        path_display_frame = ttk.Frame(path_frame)
-        path_display_frame.pack(fill=X, pady=(5, 0))
-        
-        self.path_entry = ttk.Entry(
-            path_display_frame,
-            textvariable=self.archive_path,
-            state="readonly",
-            font=("Consolas", 9)
-        )
-        self.path_entry.pack(side=LEFT, fill=X, expand=True, padx=(0, 10))
-        
-        select_btn = ttk.Button(
-            path_display_frame,
-            text="Browse...",
-            command=self.select_archive_folder,
-            bootstyle="outline-primary"
-        )
-        select_btn.pack(side=RIGHT)
-        
-        # Status display
-        status_frame = ttk.Frame(archive_frame)
-        status_frame.pack(fill=X)
-        
-        ttk.Label(status_frame, text="Status:").pack(anchor=W)
-        self.status_label = ttk.Label(
-            status_frame,
-            textvariable=self.status_var,
-            font=("Consolas", 9),
-            bootstyle="info"
-        )
-        self.status_label.pack(anchor=W, pady=(5, 0))
-        
-        # Action buttons
-        action_frame = ttk.Frame(main_frame)
-        action_frame.pack(fill=X, pady=(0, 20))
-        
-        # Button row 1
-        btn_frame1 = ttk.Frame(action_frame)
-        btn_frame1.pack(fill=X, pady=(0, 10))
-        
-        self.generate_btn = ttk.Button(
-            btn_frame1,
-            text="Generate Manifest",
-            command=self.generate_manifest,
-            bootstyle="success",
-            width=20
-        )
-        self.generate_btn.pack(side=LEFT, padx=(0, 10))
-        
-        self.verify_btn = ttk.Button(
-            btn_frame1,
-            text="Verify Integrity",
-            command=self.verify_integrity,
-            bootstyle="warning",
-            width=20
-        )
-        self.verify_btn.pack(side=LEFT, padx=(0, 10))
-        
-        # Button row 2
-        btn_frame2 = ttk.Frame(action_frame)
-        btn_frame2.pack(fill=X)
-        
-        self.settings_btn = ttk.Button(
-            btn_frame2,
-            text="Settings",
-            command=self.show_settings,
-            bootstyle="outline-secondary",
-            width=15
-        )
-        self.settings_btn.pack(side=LEFT, padx=(0, 10))
-        
-        self.logs_btn = ttk.Button(
-            btn_frame2,
-            text="View Logs",
-            command=self.show_logs,
-            bootstyle="outline-info",
-            width=15
-        )
-        self.logs_btn.pack(side=LEFT, padx=(0, 10))
-        
-        self.export_btn = ttk.Button(
-            btn_frame2,
-            text="Export Report",
-            command=self.export_report,
-            bootstyle="outline-primary",
-            width=15
-        )
-        self.export_btn.pack(side=LEFT)
-        
-        # Progress bar
-        progress_frame = ttk.Frame(main_frame)
-        progress_frame.pack(fill=X, pady=(0, 20))
+        self.setup_ui()
         
-        self.progress_bar = ttk.Progressbar(
-            progress_frame,
-            variable=self.progress_var,
-            bootstyle="success-striped"
-        )
-        self.progress_bar.pack(fill=X)
+        # Full log window, created on first use
+        self._log_window = None
         
-        # Log output
-        log_frame = ttk.LabelFrame(main_frame, text="Activity Log", padding=10)
-        log_frame.pack(fill=BOTH, expand=True)
+        # Progress reported by the worker, applied to the widget at most every PROGRESS_TICK_MS
+        self._pending_progress = None
+        self.root.after(PROGRESS_TICK_MS, self._tick_progress)
         
-        self.log_text = scrolledtext.ScrolledText(
-            log_frame,
-            height=15,
-            font=("Consolas", 9),
-            wrap=tk.WORD,
-            state=tk.DISABLED
-        )
-        self.log_text.pack(fill=BOTH, expand=True)
-        
-        # Footer
-        footer_frame = ttk.Frame(main_frame)
-        footer_frame.pack(fill=X, pady=(20, 0))
+        # Load saved state once the window has painted
+        self.root.after_idle(self._load_initial_state)
+    
+    @property
+    def checker(self):
+        """Integrity checker, created lazily to keep it off the startup path."""
+        if self._checker is None:
+            from integrity import ArchiveIntegrityChecker
+            self._checker = ArchiveIntegrityChecker()
+        return self._checker
+    
+    def _load_initial_state(self):
+        """Load the saved archive path and show the manifest status."""
+        if self.checker.config.get('archive_path'):
+            self.archive_path.set(self.checker.config['archive_path'])
         
-        ttk.Separator(footer_frame, orient=HORIZONTAL).pack(fill=X, pady=(0, 10))
+        self.update_status()
+    
+    def setup_ui(self):
+        """Setup the user interface."""
+        # One font object shared by every monospace widget
+        self._mono = tkfont.Font(family="Consolas", size=9)
         
-        footer_btn_frame = ttk.Frame(footer_frame)
-        footer_btn_frame.pack(fill=X)
+        self._build(self.root, UI_SPEC)
         
-        ttk.Button(
-            footer_btn_frame,
-            text="Exit",
-            command=self.root.quit,
-            bootstyle="outline-danger",
-            width=10
-        ).pack(side=RIGHT)
+        self.results_tree.heading("path", text="File", anchor=W)
+        self.results_tree.heading("status", text="Status", anchor=W)
+        self.results_tree.column("path", width=560)
+        self.results_tree.column("status", width=120, stretch=False)
+        self.results_tree.configure(yscrollcommand=self.results_scroll.set)
+        self.results_scroll.configure(command=self.results_tree.yview)
+    
+    def _build(self, parent, spec):
+        """Create and pack the widgets described by a UI_SPEC-style tree."""
+        for widget_type, name, options, pack_options, children in spec:
+            options = dict(options)
+            for key in _BOUND_OPTIONS:
+                if key in options:
+                    options[key] = getattr(self, options[key])
+            if options.get("font") is MONO_FONT:
+                options["font"] = self._mono
+            
+            if widget_type == "ScrolledText":
+                widget = scrolledtext.ScrolledText(parent, **options)
+            else:
+                widget = getattr(ttk, widget_type)(parent, **options)
+            
+            if name:
+                setattr(self, name, widget)
+            
+            self._build(widget, children)
+            widget.pack(**pack_options)
     
     def select_archive_folder(self):
         """Open folder dialog to select archive directory."""
         folder = filedialog.askdirectory(
             title="Select Archive Folder",
-            initialdir=self.archive_path.get() if self.archive_path.get() else os.path.expanduser("~")
+            initialdir=self.archive_path.get() or os.path.expanduser("~")
         )
         
         if folder:
@@ -213,23 +373,63 @@ class PreservGUI:
             self.update_status()
             self.log_message(f"Selected archive folder: {folder}")
     
+    def _cached_stats(self):
+        """Get manifest stats, re-reading the manifest only when it changed on disk."""
+        try:
+            mtime = os.stat(self.checker.manifest_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if self._stats_cache is None or mtime != self._stats_mtime:
+            self._stats_cache = self.checker.get_manifest_stats()
+            self._stats_mtime = mtime
+        
+        return self._stats_cache
+    
     def update_status(self):
         """Update the status display with current manifest information."""
-        stats = self.checker.get_manifest_stats()
+        stats = self._cached_stats()
         
         if stats["exists"]:
             status_text = f"Manifest exists: {stats['file_count']} files, {stats['total_size_mb']} MB"
-            if stats['last_generated']:
-                try:
-                    last_gen = datetime.fromisoformat(stats['last_generated'])
-                    status_text += f" (Last: {last_gen.strftime('%Y-%m-%d %H:%M')})"
-                except:
-                    pass
+            last_gen = self._format_last_generated(stats['last_generated'] or '')
+            if last_gen:
+                status_text += f" (Last: {last_gen})"
         else:
             status_text = "No manifest found - Generate manifest first"
         
+        self._set_status(status_text)
+    
+    def _format_last_generated(self, raw):
+        """Format an ISO timestamp for the status bar, reusing the last result if unchanged."""
+        if raw == self._last_gen_fmt_cache[0]:
+            return self._last_gen_fmt_cache[1]
+        
+        formatted = ''
+        # Cheap shape check first so obviously invalid values never raise
+        if len(raw) >= 19 and raw[4] == '-' and raw[7] == '-':
+            try:
+                formatted = datetime.fromisoformat(raw[:19]).strftime('%Y-%m-%d %H:%M')
+            except ValueError:
+                pass
+        
+        self._last_gen_fmt_cache = (raw, formatted)
+        return formatted
+    
+    def _set_status(self, status_text):
+        """Set the status text, skipping the Tk update when it is unchanged."""
+        if status_text == self._last_status_text:
+            return
+        self._last_status_text = status_text
         self.status_var.set(status_text)
     
+    def _set_progress(self, value):
+        """Set the progress bar value, skipping the Tk update when it is unchanged."""
+        if value == self._last_progress:
+            return
+        self._last_progress = value
+        self.progress_var.set(value)
+    
     def log_message(self, message):
         """Add message to log display."""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -237,72 +437,157 @@ class PreservGUI:
         
         self.log_text.config(state=tk.NORMAL)
         self.log_text.insert(tk.END, log_entry)
+        self._trim_text(self.log_text, MAX_LOG_LINES)
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
         
         # Also log to file via the checker
         self.checker.logger.info(message)
     
+    def _trim_text(self, text_widget, max_lines):
+        """Delete the oldest lines so a Text widget acts as a fixed-size ring buffer."""
+        line_count = int(text_widget.index('end-1c').split('.')[0]) - 1
+        if line_count > max_lines:
+            excess = line_count - max_lines
+            text_widget.delete('1.0', f'{excess + 1}.0')
+    
+    def _ui(self, fn, *args):
+        """Schedule fn(*args) on the GUI thread; safe to call from worker threads.
+        
+        Dropped once the window is closed.
+        """
+        if self._closed:
+            return
+        try:
+            self.root.after(0, lambda: fn(*args))
+        except (tk.TclError, RuntimeError):
+            pass  # Window destroyed after the check above
+    
     def run_with_progress(self, operation, operation_name):
-        """Run an operation with progress indication."""
-        def run_operation():
-            try:
-                self.progress_var.set(0)
-                self.status_var.set(f"Running {operation_name}...")
-                self.log_message(f"Starting {operation_name}...")
-                
-                # Disable buttons during operation
-                self.generate_btn.config(state=tk.DISABLED)
-                self.verify_btn.config(state=tk.DISABLED)
-                
-                # Run the operation
-                result = operation()
-                
-                # Update progress
-                self.progress_var.set(100)
-                
-                # Show result
-                if result.get("success"):
-                    self.log_message(f"✓ {result['message']}")
-                    self.status_var.set("Operation completed successfully")
-                else:
-                    self.log_message(f"✗ {result['message']}")
-                    self.status_var.set("Operation failed")
-                
-                # Update status
-                self.update_status()
-                
-            except Exception as e:
-                self.log_message(f"Error during {operation_name}: {str(e)}")
-                self.status_var.set("Operation failed")
-            finally:
-                # Re-enable buttons
-                self.generate_btn.config(state=tk.NORMAL)
-                self.verify_btn.config(state=tk.NORMAL)
+        """Run an operation on the worker thread with progress indication."""
+        self._set_progress(0)
+        self._set_status(f"Running {operation_name}...")
+        self.log_message(f"Starting {operation_name}...")
+        
+        # Disable buttons during operation
+        self.generate_btn.config(state=tk.DISABLED)
+        self.verify_btn.config(state=tk.DISABLED)
+        
+        # Animate until the operation reports real progress
+        self.progress_bar.configure(mode='indeterminate')
+        self.progress_bar.start(10)
+        
+        # Run on the shared worker so operations never overlap on the checker
+        future = self._executor.submit(operation)
+        future.add_done_callback(lambda f: self._ui(self._on_operation_done, f, operation_name))
+    
+    def _report_progress(self, done, total):
+        """Progress callback for the checker; safe to call from the worker thread.
         
-        # Run in separate thread to avoid blocking GUI
-        thread = threading.Thread(target=run_operation, daemon=True)
-        thread.start()
+        Only records the latest value; _tick_progress pushes it to the widget.
+        """
+        self._pending_progress = (done, total)
+    
+    def _tick_progress(self):
+        """Push the latest reported progress to the progress bar, then reschedule."""
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            self._show_progress(*pending)
+        self.root.after(PROGRESS_TICK_MS, self._tick_progress)
+    
+    def _show_progress(self, done, total):
+        """Show real progress, leaving indeterminate mode on the first report."""
+        self._stop_indeterminate()
+        self._set_progress(100 * done / total if total else 100)
+    
+    def _stop_indeterminate(self):
+        """Stop the progress bar animation and switch back to determinate mode."""
+        if str(self.progress_bar.cget('mode')) == 'indeterminate':
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode='determinate')
+            self.progress_var.set(self._last_progress)
+    
+    def _on_operation_done(self, future, operation_name):
+        """Handle a finished operation on the GUI thread."""
+        self._pending_progress = None
+        self._stop_indeterminate()
+        try:
+            self._show_result(future.result())
+        except Exception as e:
+            self.log_message(f"Error during {operation_name}: {str(e)}")
+            self._set_status("Operation failed")
+        finally:
+            # Re-enable buttons
+            self.generate_btn.config(state=tk.NORMAL)
+            self.verify_btn.config(state=tk.NORMAL)
+    
+    def _show_result(self, result):
+        """Display the result of a finished operation."""
+        # Update progress
+        self._set_progress(100)
+        
+        # Show result
+        if result.get("success"):
+            self._stats_cache = None  # Manifest may have been rewritten
+            self.log_message(f"✓ {result['message']}")
+            self._set_status("Operation completed successfully")
+        else:
+            self.log_message(f"✗ {result['message']}")
+            self._set_status("Operation failed")
+        
+        # Show per-file results
+        if "results" in result:
+            self.show_file_results(result["results"])
+        
+        # Update status
+        self.update_status()
+    
+    def show_file_results(self, results):
+        """Replace the file results list with the per-file outcome of a verification."""
+        rows = [
+            (path, status)
+            for key, status in RESULT_STATUSES
+            for path in results.get(key, [])
+        ]
+        
+        self.results_tree.delete(*self.results_tree.get_children())
+        self._result_rows = rows
+        self._insert_result_rows(rows, 0)
+    
+    def _insert_result_rows(self, rows, start, batch_size=1000):
+        """Insert result rows in batches so the window stays responsive."""
+        # Stop if a newer set of results took over
+        if self._result_rows is not rows:
+            return
+        
+        for row in rows[start:start + batch_size]:
+            self.results_tree.insert('', tk.END, values=row)
+        
+        if start + batch_size < len(rows):
+            self.root.after_idle(self._insert_result_rows, rows, start + batch_size)
     
     def generate_manifest(self):
         """Generate manifest for the selected archive."""
-        if not self.archive_path.get():
+        path = self.archive_path.get()
+        if not path:
             messagebox.showerror("Error", "Please select an archive folder first.")
             return
         
         def operation():
-            return self.checker.generate_manifest(self.archive_path.get())
+            return self.checker.generate_manifest(
+                path, progress=self._report_progress, cancelled=self._is_closed)
         
         self.run_with_progress(operation, "manifest generation")
     
     def verify_integrity(self):
         """Verify archive integrity."""
-        if not self.archive_path.get():
+        path = self.archive_path.get()
+        if not path:
             messagebox.showerror("Error", "Please select an archive folder first.")
             return
         
         def operation():
-            return self.checker.verify_integrity(self.archive_path.get())
+            return self.checker.verify_integrity(path, cancelled=self._is_closed)
         
         self.run_with_progress(operation, "integrity verification")
     
@@ -321,7 +606,7 @@ class PreservGUI:
         ttk.Label(settings_frame, text="Settings", font=("Helvetica", 16, "bold")).pack(pady=(0, 20))
         
         # Add new files option
-        add_new_var = tk.BooleanVar(value=True)
+        add_new_var = tk.BooleanVar(value=self.checker.config.get('add_new_files', True))
         ttk.Checkbutton(
             settings_frame,
             text="Automatically add new files to manifest during verification",
@@ -330,7 +615,7 @@ class PreservGUI:
         
         # Log level
         ttk.Label(settings_frame, text="Log Level:").pack(anchor=W, pady=(10, 5))
-        log_level_var = tk.StringVar(value="INFO")
+        log_level_var = tk.StringVar(value=self.checker.config.get('log_level', "INFO"))
         log_combo = ttk.Combobox(
             settings_frame,
             textvariable=log_level_var,
@@ -359,17 +644,32 @@ class PreservGUI:
     
     def save_settings(self, add_new_files, log_level, window):
         """Save settings and close dialog."""
-        # Save settings to config
-        self.checker.config['add_new_files'] = add_new_files
-        self.checker.config['log_level'] = log_level
-        self.checker._save_config()
+        window.destroy()
+        
+        changes = {'add_new_files': add_new_files, 'log_level': log_level}
+        config = self.checker.config
+        if all(config.get(key) == value for key, value in changes.items()):
+            return
+        
+        # Apply here so the next Settings dialog and the running checker see
+        # the new values at once, even while an operation is in progress
+        config.update(changes)
+        self.checker.set_log_level(log_level)
         
+        # Write a snapshot on the worker so the dialog closes without waiting
+        # on disk; this also serializes the write with any running operation
+        self._executor.submit(self.checker._save_config, dict(config))
         self.log_message("Settings saved")
-        window.destroy()
     
     def show_logs(self):
-        """Show full log window."""
+        """Show full log window, reusing it if it is already open."""
+        if self._log_window is not None and self._log_window.winfo_exists():
+            self._log_window.deiconify()
+            self._log_window.lift()
+            return
+        
         log_window = ttk.Toplevel(self.root)
+        self._log_window = log_window
         log_window.title("Full Log")
         log_window.geometry("800x600")
         log_window.transient(self.root)
@@ -382,27 +682,21 @@ class PreservGUI:
         
         log_text = scrolledtext.ScrolledText(
             log_frame,
-            font=("Consolas", 9),
-            wrap=tk.WORD
+            font=self._mono,
+            wrap=tk.WORD,
+            undo=False,
+            maxundo=0
         )
         log_text.pack(fill=BOTH, expand=True)
         
-        # Load log content
-        log_content = self.checker.get_log_content(1000)  # Get last 1000 lines
-        log_text.insert(tk.END, log_content)
-        log_text.config(state=tk.DISABLED)
+        # Load log content, then follow new entries as they are written
+        self.refresh_logs(log_text)
+        log_text.after(LOG_POLL_MS, self._tail_logs, log_text)
         
         # Buttons
         btn_frame = ttk.Frame(log_frame)
         btn_frame.pack(fill=X, pady=(20, 0))
         
-        ttk.Button(
-            btn_frame,
-            text="Refresh",
-            command=lambda: self.refresh_logs(log_text),
-            bootstyle="outline-primary"
-        ).pack(side=LEFT)
-        
         ttk.Button(
             btn_frame,
             text="Close",
@@ -414,13 +708,68 @@ class PreservGUI:
         """Refresh log content."""
         log_text.config(state=tk.NORMAL)
         log_text.delete(1.0, tk.END)
-        log_content = self.checker.get_log_content(1000)
-        log_text.insert(tk.END, log_content)
         log_text.config(state=tk.DISABLED)
+        
+        # Follow on from exactly where this read ended
+        text, self._log_pos = self.checker.read_log_tail(LOG_WINDOW_LINES)
+        lines = text.splitlines(keepends=True)
+        log_text.fill_lines = lines
+        self._fill_log_text(log_text, lines, 0)
+    
+    def _log_size(self):
+        """Current size of the log file in bytes, or 0 if it does not exist."""
+        try:
+            return os.path.getsize(self.checker.log_file)
+        except OSError:
+            return 0
+    
+    def _tail_logs(self, log_text):
+        """Append bytes written to the log since the last read, then reschedule."""
+        if not log_text.winfo_exists():
+            return
+        
+        size = self._log_size()
+        if size < self._log_pos:
+            # Log was truncated or replaced; reload it
+            self.refresh_logs(log_text)
+        elif size > self._log_pos:
+            try:
+                with open(self.checker.log_file, 'rb') as f:
+                    f.seek(self._log_pos)
+                    data = f.read(size - self._log_pos)
+            except OSError:
+                data = b''  # Log rotated or removed; the next poll reloads it
+            
+            # Only consume complete lines; a partial line is picked up next time
+            end = data.rfind(b'\n') + 1
+            if end:
+                self._log_pos += end
+                text = data[:end].decode('utf-8', errors='replace').replace('\r\n', '\n')
+                log_text.config(state=tk.NORMAL)
+                log_text.insert(tk.END, text)
+                self._trim_text(log_text, LOG_WINDOW_LINES)
+                log_text.see(tk.END)
+                log_text.config(state=tk.DISABLED)
+        
+        log_text.after(LOG_POLL_MS, self._tail_logs, log_text)
+    
+    def _fill_log_text(self, log_text, lines, start, chunk_size=200):
+        """Insert log lines a chunk at a time so the window paints before the whole buffer loads."""
+        # Stop if the window was closed or a newer refresh took over
+        if not log_text.winfo_exists() or log_text.fill_lines is not lines:
+            return
+        
+        log_text.config(state=tk.NORMAL)
+        log_text.insert(tk.END, ''.join(lines[start:start + chunk_size]))
+        log_text.config(state=tk.DISABLED)
+        
+        if start + chunk_size < len(lines):
+            log_text.after_idle(self._fill_log_text, log_text, lines, start + chunk_size)
     
     def export_report(self):
         """Export a preservation report."""
-        if not self.checker.get_manifest_stats()["exists"]:
+        stats = self._cached_stats()
+        if not stats["exists"]:
             messagebox.showerror("Error", "No manifest found. Generate manifest first.")
             return
         
@@ -433,117 +782,74 @@ class PreservGUI:
         
         if filename:
             try:
-                self.generate_report(filename)
+                self.generate_report(filename, stats, self.archive_path.get())
                 self.log_message(f"Report exported to: {filename}")
                 messagebox.showinfo("Success", f"Report exported successfully to:\n{filename}")
             except Exception as e:
                 self.log_message(f"Error exporting report: {str(e)}")
                 messagebox.showerror("Error", f"Failed to export report: {str(e)}")
     
-    def generate_report(self, filename):
-        """Generate a preservation report."""
-        stats = self.checker.get_manifest_stats()
-        
+    def generate_report(self, filename, stats, archive_path):
+        """Generate a preservation report from already-computed manifest stats."""
         if filename.endswith('.html'):
-            self.generate_html_report(filename, stats)
+            self.generate_html_report(filename, stats, archive_path)
         else:
-            self.generate_text_report(filename, stats)
+            self.generate_text_report(filename, stats, archive_path)
     
-    def generate_html_report(self, filename, stats):
+    def _report_algorithm(self, stats):
+        """Hash algorithm(s) used by the manifest, for display in reports."""
+        algorithms = stats.get('algorithms') or [self.checker.hash_algorithm]
+        return ", ".join(ALGORITHM_DISPLAY_NAMES.get(algorithm.lower(), algorithm.upper())
+                         for algorithm in algorithms)
+    
+    def _report_manifest_format(self):
+        """Storage format of the manifest, for display in reports."""
+        return "SQLite" if self.checker._manifest_is_sqlite() else "CSV"
+    
+    def generate_html_report(self, filename, stats, archive_path):
         """Generate HTML preservation report."""
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Preserv - Archive Integrity Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }}
-        .container {{ max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        h1 {{ color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }}
-        h2 {{ color: #34495e; margin-top: 30px; }}
-        .stats {{ background: #ecf0f1; padding: 20px; border-radius: 5px; margin: 20px 0; }}
-        .stat-item {{ margin: 10px 0; }}
-        .stat-label {{ font-weight: bold; color: #2c3e50; }}
-        .footer {{ margin-top: 40px; padding-top: 20px; border-top: 1px solid #bdc3c7; color: #7f8c8d; font-size: 0.9em; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Preserv - Archive Integrity Report</h1>
-        
-        <div class="stats">
-            <h2>Archive Summary</h2>
-            <div class="stat-item">
-                <span class="stat-label">Archive Path:</span> {self.archive_path.get()}
-            </div>
-            <div class="stat-item">
-                <span class="stat-label">Total Files:</span> {stats['file_count']:,}
-            </div>
-            <div class="stat-item">
-                <span class="stat-label">Total Size:</span> {stats['total_size_mb']} MB
-            </div>
-            <div class="stat-item">
-                <span class="stat-label">Last Generated:</span> {stats['last_generated']}
-            </div>
-        </div>
-        
-        <h2>Integrity Information</h2>
-        <p>This archive has been processed using Preserv Archive Integrity Checker.</p>
-        <p>All files have been verified using SHA-256 cryptographic hashing for maximum integrity assurance.</p>
-        
-        <h2>Preservation Notes</h2>
-        <ul>
-            <li>Hash Algorithm: SHA-256</li>
-            <li>Manifest Format: CSV</li>
-            <li>Incremental Checking: Enabled</li>
-            <li>Logging: Comprehensive activity logging</li>
-        </ul>
-        
-        <div class="footer">
-            <p>Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Preserv Archive Integrity Checker - Professional archival preservation tool</p>
-        </div>
-    </div>
-</body>
-</html>
-        """
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        fields = {
+            'archive_path': archive_path,
+            'file_count': f"{stats['file_count']:,}",
+            'total_size_mb': stats['total_size_mb'],
+            'last_generated': stats['last_generated'],
+            'hash_algorithm': self._report_algorithm(stats),
+            'manifest_format': self._report_manifest_format(),
+            'report_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        
+        # Write pre-encoded constant segments directly; only fields are encoded here
+        with open(filename, 'wb', buffering=1 << 16) as f:
+            for constant, field in _HTML_SEGMENTS:
+                f.write(constant)
+                if field:
+                    f.write(str(fields[field]).encode('utf-8'))
     
-    def generate_text_report(self, filename, stats):
+    def generate_text_report(self, filename, stats, archive_path):
         """Generate text preservation report."""
-        text_content = f"""
-PRESERV - ARCHIVE INTEGRITY REPORT
-==================================
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Archive Path: {self.archive_path.get()}
-
-ARCHIVE SUMMARY
----------------
-Total Files: {stats['file_count']:,}
-Total Size: {stats['total_size_mb']} MB
-Last Generated: {stats['last_generated']}
-
-INTEGRITY INFORMATION
----------------------
-This archive has been processed using Preserv Archive Integrity Checker.
-All files have been verified using SHA-256 cryptographic hashing for maximum integrity assurance.
-
-PRESERVATION NOTES
-------------------
-- Hash Algorithm: SHA-256
-- Manifest Format: CSV
-- Incremental Checking: Enabled
-- Logging: Comprehensive activity logging
-
-For detailed verification results, run the integrity verification process.
-        """
+        text_content = _TEXT_TEMPLATE.substitute(
+            archive_path=archive_path,
+            file_count=f"{stats['file_count']:,}",
+            total_size_mb=stats['total_size_mb'],
+            last_generated=stats['last_generated'],
+            hash_algorithm=self._report_algorithm(stats),
+            manifest_format=self._report_manifest_format(),
+            report_time=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
         
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
             f.write(text_content)
     
+    def _is_closed(self):
+        """Whether the window has been closed; polled by the worker to stop early."""
+        return self._closed
+    
+    def close(self):
+        """Stop the worker and close the application window."""
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def run(self):
         """Start the GUI application."""
         self.root.mainloop()
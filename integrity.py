@@ -3,9 +3,53 @@ import os
 import csv
 import json
 import logging
+import mmap
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
+
+try:
+    import blake3
+except ImportError:  # Optional: only needed for hash_algorithm "blake3"
+    blake3 = None
+
+# Algorithm used for new checksums unless config sets hash_algorithm, and
+# assumed for manifests written before the algorithm column existed
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Manifest file extensions that select SQLite storage instead of CSV
+SQLITE_MANIFEST_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+# Bytes read per chunk while hashing, unless config sets hash_chunk_size
+DEFAULT_HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are hashed through mmap, unless config sets
+# mmap_threshold (0 disables mmap)
+DEFAULT_MMAP_THRESHOLD = 64 << 20
+
+# CSV manifest columns, in the order they are written
+MANIFEST_FIELDS = ('file_path', 'checksum', 'size', 'modified_time', 'date_generated', 'algorithm')
+
+# Number of files between progress callback invocations
+PROGRESS_INTERVAL = 64
+
+
+def _fadvise(fd: int, advice: str):
+    """Give the kernel an os.posix_fadvise hint for a whole file; no-op where unsupported."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+
+class OperationCancelled(Exception):
+    """Raised inside a long operation when its cancelled callback returns True."""
 
 
 class ArchiveIntegrityChecker:
@@ -16,100 +60,434 @@ class ArchiveIntegrityChecker:
         self.manifest_file = "manifest.csv"
         self.config_file = "config.json"
         self.log_file = "integrity_log.txt"
+        self.hash_cache_file = "preserv_cache.db"
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        # Setup logging once per process; later instances share the handlers
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.FileHandler(self.log_file, encoding='utf-8'),
+                    logging.StreamHandler()
+                ]
+            )
         self.logger = logging.getLogger(__name__)
         
         # Load configuration
         self.config = self._load_config()
         
+        # Per-file messages are logged at DEBUG; set log_level to see them
+        self.set_log_level(self.config.get('log_level', 'INFO'))
+        self._log_every = self._config_int('log_every', 1000)
+        self.hash_algorithm = self._resolve_hash_algorithm(
+            self.config.get('hash_algorithm', DEFAULT_HASH_ALGORITHM))
+        self._hash_chunk_size = self._config_int('hash_chunk_size', DEFAULT_HASH_CHUNK_SIZE)
+        self._hash_workers = self._config_int('hash_workers', min(32, (os.cpu_count() or 1) * 4))
+        self._mmap_threshold = self._config_int('mmap_threshold', DEFAULT_MMAP_THRESHOLD, minimum=0)
+        
+        # Per-thread read buffers for hashing
+        self._local = threading.local()
+        
+        # Checksums keyed by (dev, inode, size, mtime_ns, algorithm); loaded per run
+        self._hash_cache = {}
+        self._hash_cache_seen = {}
+        
+    def set_log_level(self, log_level: str):
+        """Apply a log level name to this checker's logger, falling back to INFO."""
+        try:
+            self.logger.setLevel(str(log_level).upper())
+        except ValueError:
+            self.logger.warning(f"Unknown log_level {log_level!r}, using INFO")
+            self.logger.setLevel(logging.INFO)
+    
     def _load_config(self) -> Dict:
         """Load configuration from JSON file."""
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                self.logger.warning(f"Failed to load config: {e}")
+        try:
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Failed to load config: {e}")
         return {"archive_path": "", "last_run": None}
     
-    def _save_config(self):
-        """Save configuration to JSON file."""
+    def _save_config(self, config: Dict = None):
+        """Save configuration to JSON file.
+        
+        Saves the given config snapshot instead of self.config if provided.
+        """
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+                json.dump(self.config if config is None else config, f, indent=2, ensure_ascii=False)
         except Exception as e:
             self.logger.error(f"Failed to save config: {e}")
     
-    def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA-256 hash of a file using streaming for memory efficiency."""
-        hash_sha256 = hashlib.sha256()
+    def _new_hasher(self, algorithm: str):
+        """Create a hash object for a hashlib algorithm name or "blake3"."""
+        if algorithm == "blake3":
+            if blake3 is None:
+                raise ValueError("the blake3 package is not installed")
+            return blake3.blake3()
+        return hashlib.new(algorithm)
+    
+    def _resolve_hash_algorithm(self, algorithm: str) -> str:
+        """Validate the configured hash algorithm, falling back to the default.
+        
+        The probe calls digest() so that variable-length algorithms such as
+        shake_128, whose digest() needs a length, are rejected too.
+        """
+        try:
+            self._new_hasher(algorithm).digest()
+            return algorithm
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"Unsupported hash algorithm '{algorithm}' ({e}), using {DEFAULT_HASH_ALGORITHM}")
+            return DEFAULT_HASH_ALGORITHM
+    
+    def _config_int(self, key: str, default: int, minimum: int = 1) -> int:
+        """Read an integer option from config, falling back to default if invalid."""
+        value = self.config.get(key, default)
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            number = None
+        if number is None or number < minimum:
+            self.logger.warning(f"Invalid {key} {value!r}, using {default}")
+            return default
+        return number
+    
+    def _read_buffer(self) -> memoryview:
+        """Get this thread's reusable hashing buffer, avoiding a new bytes object per chunk."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None or len(buffer) != self._hash_chunk_size:
+            buffer = memoryview(bytearray(self._hash_chunk_size))
+            self._local.buffer = buffer
+        return buffer
+    
+    def _calculate_file_hash(self, file_path: str, algorithm: str = None) -> bytes:
+        """Calculate the hash of a file using streaming for memory efficiency.
+        
+        Uses the configured hash algorithm unless one is given. Returns the
+        raw digest, or b"" if the file could not be read. Files of at least
+        mmap_threshold bytes are hashed straight from a memory mapping,
+        saving the copy into a user-space buffer.
+        """
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+            hasher = self._new_hasher(algorithm or self.hash_algorithm)
+            with open(file_path, "rb", buffering=0) as f:
+                # Read-once scan: ask for aggressive readahead, then drop the
+                # pages so hashing does not evict the rest of the page cache
+                _fadvise(f.fileno(), 'POSIX_FADV_SEQUENTIAL')
+                if 0 < self._mmap_threshold <= os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher.update(mm)
+                else:
+                    # Same loop as hashlib.file_digest (which is pure Python), but
+                    # with a configurable chunk size and a buffer reused across files
+                    buffer = self._read_buffer()
+                    while True:
+                        n = f.readinto(buffer)
+                        if not n:
+                            break
+                        hasher.update(buffer[:n])
+                _fadvise(f.fileno(), 'POSIX_FADV_DONTNEED')
+            return hasher.digest()
         except Exception as e:
             self.logger.error(f"Error calculating hash for {file_path}: {e}")
-            return ""
+            return b""
+    
+    def _hash_cache_key(self, stat: os.stat_result) -> Optional[Tuple]:
+        """Cache key for a file's metadata, or None if the inode is unknown."""
+        # DirEntry.stat() reports st_ino as 0 on Windows; such keys would collide
+        if not stat.st_ino:
+            return None
+        return (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, self.hash_algorithm)
+    
+    def _load_hash_cache(self):
+        """Load previously computed checksums from the hash cache database."""
+        self._hash_cache = {}
+        self._hash_cache_seen = {}
+        if not self.config.get('hash_cache', True) or not os.path.exists(self.hash_cache_file):
+            return
+        
+        try:
+            with closing(sqlite3.connect(self.hash_cache_file)) as conn:
+                if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' "
+                                    "AND name = 'archive_hashes'").fetchone():
+                    return  # Cache from an older version; rebuilt on the next save
+                rows = conn.execute(
+                    "SELECT dev, inode, size, mtime_ns, algorithm, checksum FROM archive_hashes")
+                self._hash_cache = {tuple(row[:5]): row[5] for row in rows}
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to load hash cache: {e}")
     
-    def _get_file_info(self, file_path: str) -> Tuple[str, int, float]:
-        """Get file hash, size, and modification time."""
+    def _save_hash_cache(self, prune: bool = False):
+        """Persist checksums used in this run to the hash cache database.
+        
+        Entries are recorded against the current archive folder. With prune,
+        that archive's entries not seen in this run are dropped; use it after
+        a full archive scan so the cache does not grow without bound. Entries
+        for other archives are kept.
+        """
+        if not self.config.get('hash_cache', True) or not (self._hash_cache_seen or prune):
+            return
+        
+        archive_root = os.path.realpath(self.archive_path)
         try:
-            stat = os.stat(file_path)
-            file_hash = self._calculate_file_hash(file_path)
-            return file_hash, stat.st_size, stat.st_mtime
+            with closing(sqlite3.connect(self.hash_cache_file)) as conn, conn:
+                # Superseded by archive_hashes, which also records the archive
+                conn.execute("DROP TABLE IF EXISTS hashes")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS archive_hashes ("
+                    "archive TEXT, dev INTEGER, inode INTEGER, size INTEGER, mtime_ns INTEGER, "
+                    "algorithm TEXT, checksum BLOB, "
+                    "PRIMARY KEY (archive, dev, inode, size, mtime_ns, algorithm))")
+                if prune:
+                    conn.execute("DELETE FROM archive_hashes WHERE archive = ?", (archive_root,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO archive_hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((archive_root,) + key + (checksum,) for key, checksum in self._hash_cache_seen.items()))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Failed to save hash cache: {e}")
+    
+    def _get_file_info(self, file_path: str, stat: os.stat_result = None) -> Tuple[bytes, int, float, bool]:
+        """Get file hash, size, modification time, and whether the file was read.
+        
+        Pass stat when the caller already has it to avoid another stat call.
+        The hash is taken from the hash cache when the file's inode, size and
+        modification time are unchanged since it was last hashed; the last
+        value is False in that case.
+        """
+        try:
+            if stat is None:
+                stat = os.stat(file_path)
+            
+            key = self._hash_cache_key(stat)
+            file_hash = self._hash_cache.get(key) if key else None
+            hashed = not file_hash
+            if hashed:
+                file_hash = self._calculate_file_hash(file_path)
+            if key and file_hash:
+                self._hash_cache_seen[key] = file_hash
+            
+            return file_hash, stat.st_size, stat.st_mtime, hashed
         except Exception as e:
             self.logger.error(f"Error getting file info for {file_path}: {e}")
-            return "", 0, 0
+            return b"", 0, 0, False
+    
+    def _get_entry_info(self, entry: os.DirEntry) -> Tuple[bytes, int, float, bool]:
+        """Get file info for a directory entry, reusing its cached stat."""
+        try:
+            stat = entry.stat()
+        except OSError as e:
+            self.logger.error(f"Error getting file info for {entry.path}: {e}")
+            return b"", 0, 0, False
+        return self._get_file_info(entry.path, stat)
+    
+    def _get_files_info(self, entries: List[os.DirEntry]) -> Iterator[Tuple[os.DirEntry, Tuple[bytes, int, float, bool]]]:
+        """Get (entry, file info) for many files, hashing them on a thread pool."""
+        yield from zip(entries, self._map_hashing(self._get_entry_info, entries))
+    
+    def _map_hashing(self, fn: Callable, items: List) -> Iterator:
+        """Like map(fn, items), but run on a pool of hash_workers threads.
+        
+        hashlib releases the GIL while hashing, so threads overlap both the
+        disk reads and the hash computation. The default pool is larger than
+        the CPU count so that many small-file reads are in flight at once.
+        Only a bounded window of items is submitted ahead of the consumer,
+        and results are yielded in input order.
+        """
+        window = self._hash_workers * 4
+        executor = ThreadPoolExecutor(max_workers=self._hash_workers)
+        pending = deque()
+        try:
+            for item in items:
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(fn, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # If the consumer stops early (e.g. cancelled), drop the queued
+            # items and only wait for the files currently being hashed
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _iter_files(self, path: str, rel_dir: str = "",
+                    cancelled: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Recursively yield (relative path, directory entry) for all files under path.
+        
+        Relative paths are built up during the walk, prefixed with rel_dir.
+        Like os.walk, symlinks to files are included and symlinked
+        directories are not descended into. Unreadable directories are
+        logged and skipped. If given, cancelled is checked before each
+        directory is read and OperationCancelled is raised once it returns True.
+        """
+        if cancelled and cancelled():
+            raise OperationCancelled()
+        
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            self.logger.warning(f"Cannot read directory {path}: {e}")
+            return
+        
+        prefix = rel_dir + os.sep if rel_dir else ""
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            
+            if not is_dir:
+                yield prefix + entry.name, entry
+            elif not entry.is_symlink():
+                yield from self._iter_files(entry.path, prefix + entry.name, cancelled)
+    
+    def _manifest_is_sqlite(self) -> bool:
+        """Whether the manifest file is an SQLite database rather than CSV."""
+        return self.manifest_file.lower().endswith(SQLITE_MANIFEST_EXTENSIONS)
     
     def _load_manifest(self) -> Dict[str, Dict]:
-        """Load existing manifest from CSV file."""
+        """Load existing manifest from CSV file or SQLite database."""
+        if self._manifest_is_sqlite():
+            return self._load_sqlite_manifest()
+        
         manifest = {}
-        if os.path.exists(self.manifest_file):
-            try:
-                with open(self.manifest_file, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        manifest[row['file_path']] = {
-                            'checksum': row['checksum'],
-                            'size': int(row['size']),
-                            'modified_time': float(row['modified_time']),
-                            'date_generated': row['date_generated']
-                        }
-            except Exception as e:
-                self.logger.error(f"Error loading manifest: {e}")
+        try:
+            with open(self.manifest_file, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if header is None:
+                    return manifest
+                
+                # Positional rows avoid building a dict per row; the column
+                # indices come from the header once. Manifests written before
+                # the algorithm column existed have no index for it.
+                (path_i, checksum_i, size_i, mtime_i, date_i) = (
+                    header.index(name) for name in MANIFEST_FIELDS[:5])
+                algorithm_i = header.index('algorithm') if 'algorithm' in header else None
+                for row in reader:
+                    if not row:
+                        continue
+                    manifest[row[path_i]] = {
+                        'checksum': bytes.fromhex(row[checksum_i]),
+                        'algorithm': (row[algorithm_i] if algorithm_i is not None else "") or DEFAULT_HASH_ALGORITHM,
+                        'size': int(row[size_i]),
+                        'modified_time': float(row[mtime_i]),
+                        'date_generated': row[date_i]
+                    }
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Error loading manifest: {e}")
         return manifest
     
     def _save_manifest(self, manifest: Dict[str, Dict]):
-        """Save manifest to CSV file."""
+        """Save manifest to CSV file or SQLite database."""
         try:
-            with open(self.manifest_file, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['file_path', 'checksum', 'size', 'modified_time', 'date_generated']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
+            with self._manifest_writer() as write:
                 for file_path, info in manifest.items():
-                    writer.writerow({
-                        'file_path': file_path,
-                        'checksum': info['checksum'],
-                        'size': info['size'],
-                        'modified_time': info['modified_time'],
-                        'date_generated': info['date_generated']
-                    })
+                    write(file_path, info)
         except Exception as e:
             self.logger.error(f"Error saving manifest: {e}")
     
-    def generate_manifest(self, archive_path: str = None) -> Dict[str, any]:
-        """Generate a new manifest for the archive."""
+    def _manifest_writer(self):
+        """Open the manifest for streaming writes.
+        
+        Returns a context manager yielding write(file_path, info). Entries go
+        to disk as they are written, and replace the previous manifest only
+        when the block exits without an error.
+        """
+        if self._manifest_is_sqlite():
+            return self._sqlite_manifest_writer()
+        return self._csv_manifest_writer()
+    
+    @contextmanager
+    def _csv_manifest_writer(self) -> Iterator[Callable[[str, Dict], None]]:
+        """Stream manifest rows to a temporary CSV file, then move it into place."""
+        # On failure the partial file is left in place for inspection;
+        # a cancelled run removes it
+        temp_file = self.manifest_file + ".tmp"
+        try:
+            with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(MANIFEST_FIELDS)
+                
+                def write(file_path: str, info: Dict):
+                    writer.writerow((
+                        file_path,
+                        info['checksum'].hex(),
+                        info['size'],
+                        info['modified_time'],
+                        info['date_generated'],
+                        info['algorithm']
+                    ))
+                
+                yield write
+        except OperationCancelled:
+            os.remove(temp_file)
+            raise
+        
+        os.replace(temp_file, self.manifest_file)
+    
+    @contextmanager
+    def _sqlite_manifest_writer(self) -> Iterator[Callable[[str, Dict], None]]:
+        """Stream manifest rows into SQLite, replacing its contents in one transaction."""
+        with closing(sqlite3.connect(self.manifest_file)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS manifest ("
+                "rel_path TEXT PRIMARY KEY, checksum BLOB, size INTEGER, mtime REAL, "
+                "date_generated TEXT, algorithm TEXT)")
+            conn.execute("DELETE FROM manifest")
+            
+            def write(file_path: str, info: Dict):
+                conn.execute(
+                    "INSERT INTO manifest (rel_path, checksum, size, mtime, date_generated, algorithm) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (file_path, info['checksum'], info['size'], info['modified_time'],
+                     info['date_generated'], info['algorithm']))
+            
+            yield write
+    
+    def _load_sqlite_manifest(self) -> Dict[str, Dict]:
+        """Load existing manifest from SQLite database."""
+        manifest = {}
+        # Check first: connecting would create an empty database
+        if os.path.exists(self.manifest_file):
+            try:
+                with closing(sqlite3.connect(self.manifest_file)) as conn:
+                    rows = conn.execute(
+                        "SELECT rel_path, checksum, algorithm, size, mtime, date_generated FROM manifest")
+                    for rel_path, checksum, algorithm, size, mtime, date_generated in rows:
+                        manifest[rel_path] = {
+                            'checksum': checksum,
+                            'algorithm': algorithm,
+                            'size': size,
+                            'modified_time': mtime,
+                            'date_generated': date_generated
+                        }
+            except sqlite3.Error as e:
+                self.logger.error(f"Error loading manifest: {e}")
+        return manifest
+    
+    def _cancelled_result(self, operation_name: str) -> Dict[str, any]:
+        """Log and build the result of an operation stopped by its cancelled callback."""
+        self.logger.warning(f"{operation_name} cancelled")
+        return {"success": False, "message": f"{operation_name} cancelled"}
+    
+    def generate_manifest(self, archive_path: str = None,
+                          progress: Optional[Callable[[int, int], None]] = None,
+                          cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, any]:
+        """Generate a new manifest for the archive.
+        
+        If given, progress is called as progress(done, total) every
+        PROGRESS_INTERVAL files and once more when all files are processed.
+        If given, cancelled is checked between files; once it returns True
+        the run stops and the previous manifest is left in place.
+        """
         if archive_path:
             self.archive_path = archive_path
             self.config['archive_path'] = archive_path
@@ -119,37 +497,96 @@ class ArchiveIntegrityChecker:
         
         self.logger.info(f"Generating manifest for: {self.archive_path}")
         
-        manifest = {}
-        total_files = 0
+        self._load_hash_cache()
+        # Checksums from the previous manifest are reused for unchanged files,
+        # so re-manifesting an unchanged archive only needs a metadata scan.
+        # The manifest file is shared between archives, so only reuse it if
+        # it was last generated for this one.
+        manifest_archives = self.config.setdefault('manifest_archives', {})
+        manifest_key = os.path.realpath(self.manifest_file)
+        archive_root = os.path.realpath(self.archive_path)
+        if self.config.get('hash_cache', True) and manifest_archives.get(manifest_key) == archive_root:
+            previous = self._load_manifest()
+        else:
+            previous = {}
         processed_files = 0
+        rehashed_files = 0
+        cached_files = 0
         
-        # Count total files first
-        for root, dirs, files in os.walk(self.archive_path):
-            total_files += len(files)
+        def file_info(item: Tuple[str, os.DirEntry]) -> Tuple[str, Tuple[bytes, int, float], str]:
+            """Get (relative path, file info, checksum source) for a walked file.
+            
+            The source is "manifest", "hash cache" or "hashed" (the file was read).
+            """
+            relative_path, entry = item
+            prev = previous.get(relative_path)
+            if prev and prev['algorithm'] == self.hash_algorithm:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    stat = None
+                if stat and (stat.st_size, stat.st_mtime) == (prev['size'], prev['modified_time']):
+                    key = self._hash_cache_key(stat)
+                    if key:
+                        self._hash_cache_seen[key] = prev['checksum']
+                    return relative_path, (prev['checksum'], stat.st_size, stat.st_mtime), "manifest"
+            file_hash, file_size, mod_time, hashed = self._get_entry_info(entry)
+            return relative_path, (file_hash, file_size, mod_time), "hashed" if hashed else "hash cache"
         
-        # Process files
-        for root, dirs, files in os.walk(self.archive_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, self.archive_path)
-                
-                self.logger.info(f"Processing: {relative_path}")
-                
-                file_hash, file_size, mod_time = self._get_file_info(file_path)
-                
-                if file_hash:  # Only add if hash calculation succeeded
-                    manifest[relative_path] = {
-                        'checksum': file_hash,
-                        'size': file_size,
-                        'modified_time': mod_time,
-                        'date_generated': datetime.now().isoformat()
-                    }
-                    processed_files += 1
+        # Collect files in a single walk; this also gives the total for progress reporting
+        try:
+            entries = list(self._iter_files(self.archive_path, cancelled=cancelled))
+        except OperationCancelled:
+            return self._cancelled_result("Manifest generation")
+        total_files = len(entries)
+        
+        # Process files, writing each manifest row as soon as it is hashed;
+        # all entries from one run share a timestamp
+        run_ts = datetime.now().isoformat()
+        done_files = 0
+        try:
+            with self._manifest_writer() as write:
+                for relative_path, (file_hash, file_size, mod_time), source in self._map_hashing(file_info, entries):
+                    if cancelled and cancelled():
+                        raise OperationCancelled()
+                    
+                    if source == "hashed":
+                        rehashed_files += 1
+                        self.logger.debug(f"Processing: {relative_path} (hashed)")
+                    else:
+                        if source == "hash cache":
+                            cached_files += 1
+                        self.logger.debug(f"Processing: {relative_path} (unchanged, checksum reused from {source})")
+                    
+                    done_files += 1
+                    if done_files % self._log_every == 0:
+                        self.logger.info(f"Processed {done_files}/{total_files} files "
+                                         f"({rehashed_files} hashed, {cached_files} from hash cache)")
+                    if progress and done_files % PROGRESS_INTERVAL == 0:
+                        progress(done_files, total_files)
+                    
+                    if file_hash:  # Only add if hash calculation succeeded
+                        write(relative_path, {
+                            'checksum': file_hash,
+                            'algorithm': self.hash_algorithm,
+                            'size': file_size,
+                            'modified_time': mod_time,
+                            'date_generated': run_ts
+                        })
+                        processed_files += 1
+        except OperationCancelled:
+            return self._cancelled_result("Manifest generation")
+        except Exception as e:
+            self.logger.error(f"Error generating manifest: {e}")
+            return {"success": False, "message": f"Error generating manifest: {e}"}
+        
+        if progress:
+            progress(total_files, total_files)
         
-        # Save manifest
-        self._save_manifest(manifest)
+        self._save_hash_cache(prune=True)
         
         # Update config
+        manifest_archives[manifest_key] = archive_root
         self.config['last_run'] = datetime.now().isoformat()
         self._save_config()
         
@@ -157,14 +594,21 @@ class ArchiveIntegrityChecker:
             "success": True,
             "message": f"Manifest generated successfully. {processed_files} files processed.",
             "total_files": total_files,
-            "processed_files": processed_files
+            "processed_files": processed_files,
+            "rehashed_files": rehashed_files,
+            "cached_files": cached_files
         }
         
         self.logger.info(f"Manifest generation complete: {result['message']}")
         return result
     
-    def verify_integrity(self, archive_path: str = None, add_new_files: bool = False) -> Dict[str, any]:
-        """Verify archive integrity against existing manifest."""
+    def verify_integrity(self, archive_path: str = None, add_new_files: bool = False,
+                         cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, any]:
+        """Verify archive integrity against existing manifest.
+        
+        If given, cancelled is checked between hashed files; once it returns
+        True the run stops without updating the manifest.
+        """
         if archive_path:
             self.archive_path = archive_path
             self.config['archive_path'] = archive_path
@@ -186,66 +630,82 @@ class ArchiveIntegrityChecker:
             "errors": []
         }
         
+        # Walk the archive once; the entries carry their stat for the checks below
+        try:
+            fs_entries = dict(self._iter_files(self.archive_path, cancelled=cancelled))
+        except OperationCancelled:
+            return self._cancelled_result("Integrity verification")
+        
         # Check existing files in manifest
+        to_rehash = []
         for relative_path, manifest_info in manifest.items():
-            file_path = os.path.join(self.archive_path, relative_path)
+            entry = fs_entries.get(relative_path)
             
-            if not os.path.exists(file_path):
+            if entry is None:
                 results["missing"].append(relative_path)
                 self.logger.warning(f"MISSING: {relative_path}")
                 continue
             
             try:
-                stat = os.stat(file_path)
-                current_size = stat.st_size
-                current_mod_time = stat.st_mtime
-                
-                # Check if file needs re-hashing
-                if (current_size != manifest_info['size'] or 
-                    current_mod_time != manifest_info['modified_time']):
-                    
-                    # File changed, re-hash
-                    current_hash = self._calculate_file_hash(file_path)
-                    if current_hash == manifest_info['checksum']:
-                        results["ok"].append(relative_path)
-                        self.logger.info(f"OK: {relative_path} (size/mod time changed but hash matches)")
-                    else:
-                        results["modified"].append(relative_path)
-                        self.logger.error(f"MODIFIED: {relative_path}")
-                else:
-                    # File unchanged, skip hashing
-                    results["ok"].append(relative_path)
-                    self.logger.info(f"OK: {relative_path} (unchanged)")
-                    
+                stat = entry.stat()
             except Exception as e:
                 results["errors"].append(f"{relative_path}: {str(e)}")
                 self.logger.error(f"ERROR processing {relative_path}: {e}")
+                continue
+            
+            if (stat.st_size, stat.st_mtime) == (manifest_info['size'], manifest_info['modified_time']):
+                # File unchanged, skip hashing
+                results["ok"].append(relative_path)
+                self.logger.debug(f"OK: {relative_path} (unchanged)")
+            else:
+                # File changed, re-hash below together with the others
+                to_rehash.append((relative_path, entry.path, manifest_info))
         
-        # Check for new files
-        for root, dirs, files in os.walk(self.archive_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, self.archive_path)
-                
-                if relative_path not in manifest:
-                    results["new"].append(relative_path)
-                    self.logger.info(f"NEW: {relative_path}")
+        # Re-hash files whose size or modification time changed, in parallel
+        current_hashes = self._map_hashing(
+            lambda item: self._calculate_file_hash(item[1], item[2]['algorithm']), to_rehash)
+        for (relative_path, file_path, manifest_info), current_hash in zip(to_rehash, current_hashes):
+            if cancelled and cancelled():
+                return self._cancelled_result("Integrity verification")
+            
+            if not current_hash:
+                # Unreadable, or the recorded algorithm is unavailable here;
+                # that is not evidence of corruption
+                results["errors"].append(f"{relative_path}: could not compute {manifest_info['algorithm']} hash")
+                self.logger.error(f"ERROR processing {relative_path}: could not compute {manifest_info['algorithm']} hash")
+            elif current_hash == manifest_info['checksum']:  # raw digest bytes
+                results["ok"].append(relative_path)
+                self.logger.debug(f"OK: {relative_path} (size/mod time changed but hash matches)")
+            else:
+                results["modified"].append(relative_path)
+                self.logger.error(f"MODIFIED: {relative_path}")
+        
+        # Check for new files: on disk but not in the manifest
+        new_entries = []
+        for relative_path in sorted(fs_entries.keys() - manifest.keys()):
+            results["new"].append(relative_path)
+            new_entries.append(fs_entries[relative_path])
+            self.logger.info(f"NEW: {relative_path}")
         
         # Update manifest with new files if requested
         if add_new_files and results["new"]:
-            for relative_path in results["new"]:
-                file_path = os.path.join(self.archive_path, relative_path)
-                file_hash, file_size, mod_time = self._get_file_info(file_path)
-                
+            self._load_hash_cache()
+            new_files_info = self._get_files_info(new_entries)
+            run_ts = datetime.now().isoformat()
+            for relative_path, (entry, (file_hash, file_size, mod_time, _)) in zip(results["new"], new_files_info):
+                if cancelled and cancelled():
+                    return self._cancelled_result("Integrity verification")
                 if file_hash:
                     manifest[relative_path] = {
                         'checksum': file_hash,
+                        'algorithm': self.hash_algorithm,
                         'size': file_size,
                         'modified_time': mod_time,
-                        'date_generated': datetime.now().isoformat()
+                        'date_generated': run_ts
                     }
             
             self._save_manifest(manifest)
+            self._save_hash_cache()
             self.logger.info(f"Added {len(results['new'])} new files to manifest")
         
         # Update config
@@ -263,25 +723,74 @@ class ArchiveIntegrityChecker:
     
     def get_log_content(self, lines: int = 100) -> str:
         """Get recent log content."""
+        return self.tail_log(lines)
+    
+    def tail_log(self, n_lines: int = 100) -> str:
+        """Get the last n_lines of the log by reading backwards from the end of the file.
+        
+        n_lines <= 0 returns the whole log.
+        """
+        return self.read_log_tail(n_lines)[0]
+    
+    def read_log_tail(self, n_lines: int = 100) -> Tuple[str, int]:
+        """Like tail_log, but also return the file offset the read ended at.
+        
+        Followers can continue reading from that offset without missing or
+        repeating lines written in the meantime.
+        """
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-                return ''.join(all_lines[-lines:])
+            with open(self.log_file, 'rb') as f:
+                if n_lines <= 0:
+                    data = f.read()
+                    return data.decode('utf-8', errors='replace').replace('\r\n', '\n'), f.tell()
+                
+                size = f.seek(0, os.SEEK_END)
+                block_size = max(4096, 64 * n_lines)
+                
+                # Widen the window until it holds enough lines or reaches the start
+                while True:
+                    start = max(0, size - block_size)
+                    f.seek(start)
+                    lines = f.read().splitlines(keepends=True)
+                    end = f.tell()
+                    if start == 0 or len(lines) > n_lines:
+                        break
+                    block_size *= 2
+            
+            if start > 0:
+                lines = lines[1:]  # First line is likely partial
+            
+            return b''.join(lines[-n_lines:]).decode('utf-8', errors='replace').replace('\r\n', '\n'), end
         except Exception as e:
-            return f"Error reading log file: {e}"
+            return f"Error reading log file: {e}", 0
     
     def get_manifest_stats(self) -> Dict[str, any]:
         """Get statistics about the current manifest."""
         if not os.path.exists(self.manifest_file):
             return {"exists": False}
         
-        manifest = self._load_manifest()
-        total_size = sum(info['size'] for info in manifest.values())
+        if self._manifest_is_sqlite():
+            # Aggregate in SQLite instead of loading every row
+            try:
+                with closing(sqlite3.connect(self.manifest_file)) as conn:
+                    file_count, total_size, last_generated = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0), MAX(date_generated) FROM manifest").fetchone()
+                    algorithms = sorted(row[0] for row in conn.execute("SELECT DISTINCT algorithm FROM manifest"))
+            except sqlite3.Error as e:
+                self.logger.error(f"Error loading manifest: {e}")
+                file_count, total_size, last_generated, algorithms = 0, 0, None, []
+        else:
+            manifest = self._load_manifest()
+            file_count = len(manifest)
+            total_size = sum(info['size'] for info in manifest.values())
+            last_generated = max(info['date_generated'] for info in manifest.values()) if manifest else None
+            algorithms = sorted({info['algorithm'] for info in manifest.values()})
         
         return {
             "exists": True,
-            "file_count": len(manifest),
+            "file_count": file_count,
             "total_size": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "last_generated": max(info['date_generated'] for info in manifest.values()) if manifest else None
+            "last_generated": last_generated,
+            "algorithms": algorithms
         }
@@ -15,7 +15,6 @@ import argparse
 import os
 from pathlib import Path
 from integrity import ArchiveIntegrityChecker
-from gui import PreservGUI
 
 
 def main():
@@ -87,6 +86,7 @@ Examples:
 def launch_gui():
     """Launch the GUI application."""
     try:
+        from gui import PreservGUI
         app = PreservGUI()
         print("Starting Preserv Archive Integrity Checker...")
         print("GUI launched successfully.")
@@ -98,6 +98,8 @@ def launch_gui():
 
 def run_cli_mode(args):
     """Run Preserv in command-line mode."""
+    checker = ArchiveIntegrityChecker()
+    
     # Determine archive path
     archive_path = None
     
@@ -107,7 +109,6 @@ def run_cli_mode(args):
         archive_path = args.generate
     else:
         # Try to get from config
-        checker = ArchiveIntegrityChecker()
         archive_path = checker.config.get('archive_path')
         
         if not archive_path:
@@ -120,8 +121,7 @@ def run_cli_mode(args):
         print(f"Error: Archive path does not exist: {archive_path}")
         sys.exit(1)
     
-    # Initialize checker
-    checker = ArchiveIntegrityChecker(archive_path)
+    checker.archive_path = archive_path
     
     # Override file paths if specified
     if args.config:
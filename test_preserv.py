@@ -135,6 +135,256 @@ def test_integrity_checker():
     return True
 
 
+def test_sqlite_manifest():
+    """Test storing the manifest in an SQLite database."""
+    print("\n🔄 Testing SQLite manifest...")
+    
+    with tempfile.TemporaryDirectory() as test_dir, tempfile.TemporaryDirectory() as manifest_dir:
+        test_files = create_test_files(test_dir)
+        
+        checker = ArchiveIntegrityChecker(test_dir)
+        checker.manifest_file = os.path.join(manifest_dir, "manifest.db")
+        
+        result = checker.generate_manifest(test_dir)
+        if not result["success"] or result["processed_files"] != len(test_files):
+            print(f"❌ SQLite manifest generation failed: {result['message']}")
+            return False
+        
+        stats = checker.get_manifest_stats()
+        if stats["file_count"] != len(test_files):
+            print(f"❌ SQLite manifest stats wrong: {stats}")
+            return False
+        
+        result = checker.verify_integrity(test_dir)
+        if len(result["results"]["ok"]) != len(test_files):
+            print(f"❌ SQLite manifest verification failed: {result['message']}")
+            return False
+    
+    print("✅ SQLite manifest generated and verified")
+    return True
+
+
+def count_hashed_files(checker):
+    """Wrap checker._calculate_file_hash so it counts the files actually read."""
+    calls = []
+    calculate = checker._calculate_file_hash
+    
+    def counting(file_path, algorithm=None):
+        calls.append(file_path)
+        return calculate(file_path, algorithm)
+    
+    checker._calculate_file_hash = counting
+    return calls
+
+
+def test_hash_cache():
+    """Test that the hash cache skips unchanged files and misses after a change."""
+    print("\n🔄 Testing hash cache...")
+    
+    with tempfile.TemporaryDirectory() as test_dir, tempfile.TemporaryDirectory() as other_dir, \
+            tempfile.TemporaryDirectory() as manifest_dir:
+        test_files = create_test_files(test_dir)
+        create_test_files(other_dir)
+        
+        checker = ArchiveIntegrityChecker(test_dir)
+        checker.manifest_file = os.path.join(manifest_dir, "manifest.csv")
+        checker.hash_cache_file = os.path.join(manifest_dir, "cache.db")
+        checker.generate_manifest(test_dir)
+        checksums = {path: info['checksum'] for path, info in checker._load_manifest().items()}
+        
+        # Remove the manifest so only the hash cache can supply checksums
+        os.remove(checker.manifest_file)
+        calls = count_hashed_files(checker)
+        result = checker.generate_manifest(test_dir)
+        if result["rehashed_files"] != 0 or result["cached_files"] != len(test_files):
+            print(f"❌ Hash cache hit reported {result['rehashed_files']} hashed, {result['cached_files']} cached")
+            return False
+        if calls or {path: info['checksum'] for path, info in checker._load_manifest().items()} != checksums:
+            print(f"❌ Hash cache hit still read {len(calls)} files")
+            return False
+        
+        # A new modification time must miss the cache
+        changed = os.path.join(test_dir, "document1.txt")
+        stat = os.stat(changed)
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        os.remove(checker.manifest_file)
+        checker.generate_manifest(test_dir)
+        if calls != [changed]:
+            print(f"❌ Hash cache miss after mtime change read {calls}")
+            return False
+        
+        # Scanning another archive must not drop the first archive's entries
+        checker.generate_manifest(other_dir)
+        calls.clear()
+        os.remove(checker.manifest_file)
+        checker.generate_manifest(test_dir)
+        if calls:
+            print(f"❌ Hash cache lost entries after scanning another archive: read {len(calls)} files")
+            return False
+    
+    print("✅ Hash cache skipped unchanged files and re-hashed the changed one")
+    return True
+
+
+def test_manifest_compatibility():
+    """Test legacy manifests without an algorithm column and per-row algorithms."""
+    print("\n🔄 Testing manifest compatibility...")
+    
+    with tempfile.TemporaryDirectory() as test_dir, tempfile.TemporaryDirectory() as manifest_dir:
+        test_files = create_test_files(test_dir)
+        
+        checker = ArchiveIntegrityChecker(test_dir)
+        checker.manifest_file = os.path.join(manifest_dir, "manifest.csv")
+        checker.hash_cache_file = os.path.join(manifest_dir, "cache.db")
+        
+        # Manifest in the original five-column format
+        with open(checker.manifest_file, 'w', encoding='utf-8') as f:
+            f.write("file_path,checksum,size,modified_time,date_generated\n")
+            for file_path in test_files:
+                full_path = os.path.join(test_dir, file_path)
+                with open(full_path, 'rb') as data:
+                    checksum = hashlib.sha256(data.read()).hexdigest()
+                stat = os.stat(full_path)
+                f.write(f"{os.path.normpath(file_path)},{checksum},{stat.st_size},"
+                        f"{stat.st_mtime},2020-01-01T00:00:00\n")
+        
+        manifest = checker._load_manifest()
+        if len(manifest) != len(test_files) or any(
+                info['algorithm'] != "sha256" for info in manifest.values()):
+            print(f"❌ Legacy manifest loaded wrongly: {manifest}")
+            return False
+        
+        # Force a re-hash so the legacy checksums are actually compared
+        for info in manifest.values():
+            info['modified_time'] -= 1
+        checker._save_manifest(manifest)
+        result = checker.verify_integrity(test_dir)
+        if len(result["results"]["ok"]) != len(test_files):
+            print(f"❌ Legacy manifest verification failed: {result['message']}")
+            return False
+        
+        # Switch algorithm: old rows keep verifying with sha256, new rows use sha512
+        checker.hash_algorithm = "sha512"
+        with open(os.path.join(test_dir, "newfile.txt"), 'w', encoding='utf-8') as f:
+            f.write("This is a new file")
+        checker.verify_integrity(test_dir, add_new_files=True)
+        
+        manifest = checker._load_manifest()
+        for info in manifest.values():
+            info['modified_time'] -= 1
+        checker._save_manifest(manifest)
+        result = checker.verify_integrity(test_dir)
+        algorithms = checker.get_manifest_stats()["algorithms"]
+        if len(result["results"]["ok"]) != len(test_files) + 1 or algorithms != ["sha256", "sha512"]:
+            print(f"❌ Mixed-algorithm verification failed: {result['message']}, {algorithms}")
+            return False
+    
+    print("✅ Legacy and mixed-algorithm manifests verified")
+    return True
+
+
+def test_manifest_reuse():
+    """Test that checksums are only reused from a manifest of the same archive."""
+    print("\n🔄 Testing manifest reuse...")
+    
+    with tempfile.TemporaryDirectory() as archive_a, tempfile.TemporaryDirectory() as archive_b, \
+            tempfile.TemporaryDirectory() as manifest_dir:
+        # Same name, size and modification time, different content
+        for archive, content in ((archive_a, b"content A"), (archive_b, b"content B")):
+            file_path = os.path.join(archive, "f.txt")
+            with open(file_path, 'wb') as f:
+                f.write(content)
+            os.utime(file_path, (1_600_000_000, 1_600_000_000))
+        
+        checker = ArchiveIntegrityChecker(archive_a)
+        checker.manifest_file = os.path.join(manifest_dir, "manifest.csv")
+        checker.hash_cache_file = os.path.join(manifest_dir, "cache.db")
+        checker.generate_manifest(archive_a)
+        
+        result = checker.generate_manifest(archive_b)
+        checksum = checker._load_manifest()["f.txt"]["checksum"]
+        if result["rehashed_files"] != 1 or checksum != hashlib.sha256(b"content B").digest():
+            print("❌ Checksum reused from another archive's manifest")
+            return False
+        
+        # Re-generating an unchanged archive reuses checksums but refreshes the date
+        manifest = checker._load_manifest()
+        manifest["f.txt"]["date_generated"] = "2020-01-01T00:00:00"
+        checker._save_manifest(manifest)
+        result = checker.generate_manifest(archive_b)
+        last_generated = checker.get_manifest_stats()["last_generated"]
+        if result["rehashed_files"] != 0 or last_generated == "2020-01-01T00:00:00":
+            print(f"❌ Unchanged re-generation: {result['rehashed_files']} hashed, last generated {last_generated}")
+            return False
+    
+    print("✅ Manifest checksums reused only for the same archive")
+    return True
+
+
+def test_mmap_hashing():
+    """Test that hashing through mmap gives the same digests as hashlib."""
+    print("\n🔄 Testing mmap hashing...")
+    
+    with tempfile.TemporaryDirectory() as test_dir:
+        checker = ArchiveIntegrityChecker()
+        checker._mmap_threshold = 1  # Every non-empty file goes through mmap
+        
+        contents = {
+            "empty.bin": b"",
+            "small.bin": b"hello",
+            "chunks.bin": os.urandom(3 * checker._hash_chunk_size + 17),
+        }
+        for name, content in contents.items():
+            file_path = os.path.join(test_dir, name)
+            with open(file_path, 'wb') as f:
+                f.write(content)
+            
+            if checker._calculate_file_hash(file_path) != hashlib.sha256(content).digest():
+                print(f"❌ mmap hash of {name} does not match hashlib")
+                return False
+    
+    print("✅ mmap hashing matches hashlib")
+    return True
+
+
+def test_tail_log():
+    """Test reading the last lines of the log file."""
+    print("\n🔄 Testing log tail...")
+    
+    with tempfile.TemporaryDirectory() as log_dir:
+        checker = ArchiveIntegrityChecker()
+        checker.log_file = os.path.join(log_dir, "log.txt")
+        
+        # Larger than the first block read, so the window has to widen
+        lines = [f"line {i}\n" for i in range(5000)]
+        with open(checker.log_file, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        
+        checks = [
+            (checker.tail_log(0), "".join(lines)),
+            (checker.tail_log(1), lines[-1]),
+            (checker.tail_log(1000), "".join(lines[-1000:])),
+            (checker.tail_log(10000), "".join(lines)),
+        ]
+        
+        # Smaller than a block, without a trailing newline
+        with open(checker.log_file, 'w', encoding='utf-8') as f:
+            f.write("first\nsecond\nlast")
+        checks += [
+            (checker.tail_log(1), "last"),
+            (checker.tail_log(2), "second\nlast"),
+            (checker.tail_log(0), "first\nsecond\nlast"),
+        ]
+        
+        for actual, expected in checks:
+            if actual != expected:
+                print(f"❌ Log tail returned {actual[-40:]!r}, expected {expected[-40:]!r}")
+                return False
+    
+    print("✅ Log tail returned the expected lines")
+    return True
+
+
 def test_gui_import():
     """Test that GUI can be imported."""
     print("\n🔄 Testing GUI import...")
@@ -157,6 +407,36 @@ def main():
         print("\n❌ Core functionality tests failed")
         return False
     
+    # Test SQLite manifest storage
+    if not test_sqlite_manifest():
+        print("\n❌ SQLite manifest test failed")
+        return False
+    
+    # Test hash cache
+    if not test_hash_cache():
+        print("\n❌ Hash cache test failed")
+        return False
+    
+    # Test manifest compatibility
+    if not test_manifest_compatibility():
+        print("\n❌ Manifest compatibility test failed")
+        return False
+    
+    # Test manifest reuse
+    if not test_manifest_reuse():
+        print("\n❌ Manifest reuse test failed")
+        return False
+    
+    # Test mmap hashing
+    if not test_mmap_hashing():
+        print("\n❌ mmap hashing test failed")
+        return False
+    
+    # Test log tail
+    if not test_tail_log():
+        print("\n❌ Log tail test failed")
+        return False
+    
     # Test GUI import
     if not test_gui_import():
         print("\n❌ GUI import test failed")